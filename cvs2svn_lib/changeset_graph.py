@@ -52,11 +52,15 @@ class _NoPredNodes(object):
 
     self.changeset_db = changeset_db
 
-    # A heapified list of (node.time_range, changeset, node) tuples
-    # that have no predecessors.  These tuples sort in the desired
-    # commit order:
+    # A heapified list of (t_max, t_min, changeset, node) tuples that
+    # have no predecessors.  These tuples sort in the desired commit
+    # order.  (t_max and t_min are stored as separate elements rather
+    # than as the node's TimeRange so that most heap comparisons are
+    # C-level integer compares instead of calls into
+    # TimeRange.__cmp__.)
     self._nodes = [
-      (node.time_range, self.changeset_db[node.id], node)
+      (node.time_range.t_max, node.time_range.t_min,
+       self.changeset_db[node.id], node)
       for node in initial_nodes
       ]
     heapq.heapify(self._nodes)
@@ -65,7 +69,10 @@ class _NoPredNodes(object):
     return len(self._nodes)
 
   def add(self, node):
-    node = (node.time_range, self.changeset_db[node.id], node)
+    node = (
+        node.time_range.t_max, node.time_range.t_min,
+        self.changeset_db[node.id], node,
+        )
     heapq.heappush(self._nodes, node)
 
   def get(self):
@@ -75,7 +82,7 @@ class _NoPredNodes(object):
     self._nodes; namely, the changeset with the earliest time_range,
     with ties broken by comparing the changesets themselves."""
 
-    (time_range, changeset, node) = heapq.heappop(self._nodes)
+    (t_max, t_min, changeset, node) = heapq.heappop(self._nodes)
     return (node, changeset)
 
 
@@ -316,6 +323,10 @@ class ChangesetGraph(object):
     node = self[starting_node_id]
 
     seen_nodes = [node]
+    # A map { node_id : index in SEEN_NODES }, so that checking
+    # whether a node has been seen before is a hash lookup rather
+    # than a linear scan of SEEN_NODES:
+    seen_node_indexes = {node.id : 0}
 
     # Follow it backwards until a node is seen a second time; then we
     # have our cycle.
@@ -327,9 +338,9 @@ class ChangesetGraph(object):
       except StopIteration:
         raise NoPredNodeInGraphException(node)
       node = self[node_id]
-      try:
-        i = seen_nodes.index(node)
-      except ValueError:
+      i = seen_node_indexes.get(node.id)
+      if i is None:
+        seen_node_indexes[node.id] = len(seen_nodes)
         seen_nodes.append(node)
       else:
         seen_nodes = seen_nodes[i:]
@@ -335,7 +335,7 @@ class TextRecordDatabase:
 
     There must not already be a record with the same id."""
 
-    assert not self.text_records.has_key(text_record.id)
+    assert text_record.id not in self.text_records
 
     self.text_records[text_record.id] = text_record
 
@@ -352,7 +352,7 @@ class TextRecordDatabase:
 
     Do not do anything with the old record."""
 
-    assert self.text_records.has_key(text_record.id)
+    assert text_record.id in self.text_records
     self.text_records[text_record.id] = text_record
 
   def discard(self, *ids):
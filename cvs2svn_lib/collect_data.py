@@ -698,6 +698,8 @@ class _FileDataCollector(Sink):
   def _resolve_branch_dependencies(self):
     """Resolve dependencies involving branches."""
 
+    # A branch that references a non-existing revision is deleted from
+    # branches_data below, so iterate over a copy of the values:
     for branch_data in self.sdc.branches_data.values():
       # The branch_data's parent has the branch as a child regardless
       # of whether the branch had any subsequent commits:
@@ -735,12 +737,14 @@ class _FileDataCollector(Sink):
     branch number; therefore branch numbers are not an indication of
     creation order.)"""
 
-    for rev_data in self._rev_data.values():
-      rev_data.branches_data.sort(lambda a, b: - cmp(a.id, b.id))
+    for rev_data in self._rev_data.itervalues():
+      rev_data.branches_data.sort(key=lambda branch_data: -branch_data.id)
 
   def _resolve_tag_dependencies(self):
     """Resolve dependencies involving tags."""
 
+    # Tags that reference a non-existing revision are deleted from
+    # tags_data below, so iterate over a copy of the items:
     for (rev, tag_data_list) in self.sdc.tags_data.items():
       try:
         parent_data = self._rev_data[rev]
@@ -763,7 +767,7 @@ class _FileDataCollector(Sink):
   def _get_cvs_branches(self):
     """Generate the CVSBranches present in this file."""
 
-    for branch_data in self.sdc.branches_data.values():
+    for branch_data in self.sdc.branches_data.itervalues():
       yield CVSBranch(
           branch_data.id, self.cvs_file, branch_data.symbol,
           branch_data.branch_number,
@@ -776,7 +780,7 @@ class _FileDataCollector(Sink):
   def _get_cvs_tags(self):
     """Generate the CVSTags present in this file."""
 
-    for tags_data in self.sdc.tags_data.values():
+    for tags_data in self.sdc.tags_data.itervalues():
       for tag_data in tags_data:
         yield CVSTag(
             tag_data.id, self.cvs_file, tag_data.symbol,
@@ -838,7 +842,7 @@ class _FileDataCollector(Sink):
     This is a callback method declared in Sink."""
 
     # Make sure that there was an info section for each revision:
-    for cvs_item in self._cvs_file_items.values():
+    for cvs_item in self._cvs_file_items.itervalues():
       if isinstance(cvs_item, CVSRevision) and cvs_item.metadata_id is None:
         self.collect_data.record_fatal_error(
             '%r has no deltatext section for revision %s'
@@ -1128,7 +1132,7 @@ class CollectData:
     self._cvs_item_store.add(cvs_file_items)
 
     self.stats_keeper.record_cvs_file(cvs_file_items.cvs_file)
-    for cvs_item in cvs_file_items.values():
+    for cvs_item in cvs_file_items.itervalues():
       self.stats_keeper.record_cvs_item(cvs_item)
 
   def register_trunk(self, trunk):
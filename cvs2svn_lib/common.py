@@ -100,7 +100,12 @@ def path_join(*components):
   """Join two or more pathname COMPONENTS, inserting '/' as needed.
   Empty component are skipped."""
 
-  return '/'.join(filter(None, components))
+  if all(components):
+    # The common case; join the components tuple directly without
+    # allocating an intermediate filtered list:
+    return '/'.join(components)
+  else:
+    return '/'.join([c for c in components if c])
 
 
 def path_split(path):
@@ -174,6 +174,14 @@ class CVSFileItems(object):
   def values(self):
     return self._cvs_items.values()
 
+  def itervalues(self):
+    """Iterate over the CVSItems without materializing a list.
+
+    This must not be used if the caller modifies the store while
+    iterating."""
+
+    return self._cvs_items.itervalues()
+
   def check_link_consistency(self):
     """Check that the CVSItems are linked correctly with each other."""
 
@@ -1106,7 +1114,7 @@ class CVSFileItems(object):
   def record_opened_symbols(self):
     """Set CVSRevision.opened_symbols for the surviving revisions."""
 
-    for cvs_item in self.values():
+    for cvs_item in self.itervalues():
       if isinstance(cvs_item, (CVSRevision, CVSBranch)):
         cvs_item.opened_symbols = []
         for cvs_symbol_opened_id in cvs_item.get_cvs_symbol_ids_opened():
@@ -1123,7 +1131,7 @@ class CVSFileItems(object):
 
     This method must be called after record_opened_symbols()."""
 
-    for cvs_item in self.values():
+    for cvs_item in self.itervalues():
       if isinstance(cvs_item, CVSRevision):
         cvs_item.closed_symbols = []
         for cvs_item_closed_id in cvs_item.get_ids_closed():
@@ -51,6 +51,8 @@ CVSItem
 """
 
 
+import itertools
+
 from cvs2svn_lib.context import Ctx
 
 
@@ -318,8 +320,9 @@ class CVSRevision(CVSItem):
      self.opened_symbols, self.closed_symbols,
      self.properties, self.properties_changed,
      self.revision_reader_token) = data
-    self.cvs_file = Ctx()._cvs_path_db.get_path(cvs_file_id)
-    self.lod = Ctx()._symbol_db.get_symbol(lod_id)
+    ctx = Ctx()
+    self.cvs_file = ctx._cvs_path_db.get_path(cvs_file_id)
+    self.lod = ctx._symbol_db.get_symbol(lod_id)
 
   def get_properties(self):
     """Return all of the properties needed for this CVSRevision.
@@ -383,10 +386,7 @@ class CVSRevision(CVSItem):
   def get_symbol_succ_ids(self):
     """Return the succ_ids for symbol successors."""
 
-    retval = set()
-    for id in self.branch_ids + self.tag_ids:
-      retval.add(id)
-    return retval
+    return set(itertools.chain(self.branch_ids, self.tag_ids))
 
   def get_succ_ids(self):
     retval = self.get_symbol_succ_ids()
@@ -573,7 +573,9 @@ class CVSRevisionModification(CVSRevision):
   __slots__ = []
 
   def get_cvs_symbol_ids_opened(self):
-    return self.tag_ids + self.branch_ids
+    # Callers only iterate over the result, so chain the two lists
+    # instead of allocating their concatenation:
+    return itertools.chain(self.tag_ids, self.branch_ids)
 
 
 class CVSRevisionAdd(CVSRevisionModification):
@@ -781,21 +783,22 @@ class CVSBranch(CVSSymbol):
         self.opened_symbols,
         self.revision_reader_token,
         ) = data
-    self.cvs_file = Ctx()._cvs_path_db.get_path(cvs_file_id)
-    self.symbol = Ctx()._symbol_db.get_symbol(symbol_id)
-    self.source_lod = Ctx()._symbol_db.get_symbol(source_lod_id)
+    ctx = Ctx()
+    self.cvs_file = ctx._cvs_path_db.get_path(cvs_file_id)
+    self.symbol = ctx._symbol_db.get_symbol(symbol_id)
+    self.source_lod = ctx._symbol_db.get_symbol(source_lod_id)
 
   def get_pred_ids(self):
     return set([self.source_id])
 
   def get_succ_ids(self):
-    retval = set(self.tag_ids + self.branch_ids)
+    retval = set(itertools.chain(self.tag_ids, self.branch_ids))
     if self.next_id is not None:
       retval.add(self.next_id)
     return retval
 
   def get_cvs_symbol_ids_opened(self):
-    return self.tag_ids + self.branch_ids
+    return itertools.chain(self.tag_ids, self.branch_ids)
 
   def check_links(self, cvs_file_items):
     source = cvs_file_items.get(self.source_id)
@@ -904,9 +907,10 @@ class CVSTag(CVSSymbol):
         self.id, cvs_file_id, symbol_id, source_lod_id, self.source_id,
         self.revision_reader_token,
         ) = data
-    self.cvs_file = Ctx()._cvs_path_db.get_path(cvs_file_id)
-    self.symbol = Ctx()._symbol_db.get_symbol(symbol_id)
-    self.source_lod = Ctx()._symbol_db.get_symbol(source_lod_id)
+    ctx = Ctx()
+    self.cvs_file = ctx._cvs_path_db.get_path(cvs_file_id)
+    self.symbol = ctx._symbol_db.get_symbol(symbol_id)
+    self.source_lod = ctx._symbol_db.get_symbol(source_lod_id)
 
   def get_pred_ids(self):
     return set([self.source_id])
@@ -42,6 +42,11 @@ cvs_item_primer = (
     )
 
 
+# The buffer size to use for the sortable datafiles, which are written
+# and scanned strictly sequentially (same sizing as in sort.py):
+BUFSIZE = 64 * 1024
+
+
 class NewCVSItemStore:
   """A file of sequential CVSItems, grouped by CVSFile.
 
@@ -164,7 +169,7 @@ class NewSortableCVSRevisionDatabase(object):
   This class creates such files."""
 
   def __init__(self, filename, serializer):
-    self.f = open(filename, 'w')
+    self.f = open(filename, 'w', BUFSIZE)
     self.serializer = LinewiseSerializer(serializer)
 
   def add(self, cvs_rev):
@@ -190,7 +195,7 @@ class OldSortableCVSRevisionDatabase(object):
     self.serializer = LinewiseSerializer(serializer)
 
   def __iter__(self):
-    f = open(self.filename, 'r')
+    f = open(self.filename, 'r', BUFSIZE)
     for l in f:
       s = l.split(' ', 2)[-1]
       yield self.serializer.loads(s)
@@ -206,7 +211,7 @@ class NewSortableCVSSymbolDatabase(object):
   This class creates such files."""
 
   def __init__(self, filename, serializer):
-    self.f = open(filename, 'w')
+    self.f = open(filename, 'w', BUFSIZE)
     self.serializer = LinewiseSerializer(serializer)
 
   def add(self, cvs_symbol):
@@ -229,7 +234,7 @@ class OldSortableCVSSymbolDatabase(object):
     self.serializer = LinewiseSerializer(serializer)
 
   def __iter__(self):
-    f = open(self.filename, 'r')
+    f = open(self.filename, 'r', BUFSIZE)
     for l in f:
       s = l.split(' ', 1)[-1]
       yield self.serializer.loads(s)
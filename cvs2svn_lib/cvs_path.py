@@ -55,6 +55,11 @@ class CVSPath(object):
         all CVSFiles have been processed.  Comparisons of CVSPath
         using __cmp__() simply compare the ordinals.
 
+    ancestry -- (list of CVSPath) the CVSPaths leading from the root
+        path to SELF, starting with self.project's root directory and
+        ending with self.  This list is shared (each path's ancestry
+        is built from its parent's); callers must not modify it.
+
   """
 
   __slots__ = [
@@ -64,6 +69,8 @@ class CVSPath(object):
       'rcs_basename',
       'ordinal',
       'rcs_path',
+      'cvs_path',
+      'ancestry',
       ]
 
   def __init__(self, id, project, parent_directory, rcs_basename):
@@ -87,6 +94,23 @@ class CVSPath(object):
     # So now we precalculate this and just return it.
     self.rcs_path = os.path.normpath(self._calculate_rcs_path())
 
+    # The canonical path within the project is also requested over and
+    # over again (e.g., for every path written to the output), so
+    # precalculate it for the same reason:
+    self.cvs_path = path_join(*self.get_path_components(rcs=False))
+
+    # The ancestry is walked once per repository mirror traversal
+    # (i.e., for every path added to, copied within, or deleted from
+    # the output), so precalculate it, too.  The parent's ancestry is
+    # already available, so this costs only one list per path:
+    self.ancestry = self._calculate_ancestry()
+
+  def _calculate_ancestry(self):
+    if self.parent_directory is None:
+      return [self]
+    else:
+      return self.parent_directory.ancestry + [self]
+
   def __getstate__(self):
     """This method must only be called after ordinal has been set."""
 
@@ -104,21 +128,17 @@ class CVSPath(object):
         ) = state
     self.project = Ctx()._projects[project_id]
     self.rcs_path = os.path.normpath(self._calculate_rcs_path())
+    self.cvs_path = path_join(*self.get_path_components(rcs=False))
+    self.ancestry = self._calculate_ancestry()
 
   def get_ancestry(self):
     """Return a list of the CVSPaths leading from the root path to SELF.
 
     Return the CVSPaths in a list, starting with
-    self.project.get_root_cvs_directory() and ending with self."""
+    self.project.get_root_cvs_directory() and ending with self.  The
+    returned list is shared; it must not be modified."""
 
-    ancestry = []
-    p = self
-    while p is not None:
-      ancestry.append(p)
-      p = p.parent_directory
-
-    ancestry.reverse()
-    return ancestry
+    return self.ancestry
 
   def get_path_components(self, rcs=False):
     """Return the path components to this CVSPath.
@@ -150,9 +170,7 @@ class CVSPath(object):
 
     """
 
-    return path_join(*self.get_path_components(rcs=False))
-
-  cvs_path = property(get_cvs_path)
+    return self.cvs_path
 
   def _calculate_rcs_path(self):
     """Return the filesystem path in the CVS repo corresponding to SELF."""
@@ -232,8 +232,7 @@ class DVCSOutputOption(OutputOption):
     # parent is processed first:
     lod_ranges = lod_range_maps.items()
     lod_ranges.sort(
-        lambda (lod1,lod_range_map1),(lod2,lod_range_map2):
-        -cmp(len(lod_range_map1), len(lod_range_map2)) or cmp(lod1, lod2)
+        key=lambda (lod, lod_range_map): (-len(lod_range_map), lod)
         )
 
     source_groups = []
@@ -43,7 +43,7 @@ class FillSource:
 
   These objects are used by the symbol filler in SVNOutputOption."""
 
-  def __init__(self, cvs_path, symbol, node_tree):
+  def __init__(self, cvs_path, symbol, node_tree, revision_ranges_cache=None):
     """Create a fill source.
 
     The best LOD and SVN REVNUM to use as the copy source can be
@@ -61,11 +61,20 @@ class FillSource:
           of SVN revision numbers from which the CVSPath can be
           copied.
 
+      _revision_ranges_cache -- (dict) a map { id(node) : [
+          SVNRevisionRange, ...] } memoizing the revision ranges found
+          within each directory node.  The cache is shared with the
+          FillSources for all subsources, so that each subtree only
+          has to be walked once per symbol fill.
+
     """
 
     self.cvs_path = cvs_path
     self._symbol = symbol
     self._node_tree = node_tree
+    if revision_ranges_cache is None:
+      revision_ranges_cache = {}
+    self._revision_ranges_cache = revision_ranges_cache
 
   def _set_node(self, cvs_file, svn_revision_range):
     parent_node = self._get_node(cvs_file.parent_directory, create=True)
@@ -100,6 +109,24 @@ class FillSource:
     sort order).  The return value's source_lod is the best LOD to
     copy from, and its opening_revnum is the best SVN revision."""
 
+    if isinstance(self._node_tree, SVNRevisionRange):
+      # A leaf node (i.e., a single file).  The leaf's own range is
+      # the only possible source, so the scoring machinery can be
+      # skipped: the best revision is the range's opening, or the
+      # preferred source's opening if it falls within the range.
+      if (
+          preferred_source is not None
+          and preferred_source.source_lod == self._node_tree.source_lod
+          and preferred_source.opening_revnum in self._node_tree
+          ):
+        return SVNRevisionRange(
+            preferred_source.source_lod, preferred_source.opening_revnum
+            )
+      else:
+        return SVNRevisionRange(
+            self._node_tree.source_lod, self._node_tree.opening_revnum
+            )
+
     # Aggregate openings and closings from our rev tree
     svn_revision_ranges = self._get_revision_ranges(self._node_tree)
 
@@ -128,24 +155,34 @@ class FillSource:
     """Return a list of all the SVNRevisionRanges at and under NODE.
 
     Include duplicates.  This is a helper method used by
-    compute_best_source()."""
+    compute_best_source().  The result for each directory node is
+    memoized in self._revision_ranges_cache, so a subtree does not
+    have to be re-walked when its subsources are filled later in the
+    same symbol fill."""
 
     if isinstance(node, SVNRevisionRange):
       # It is a leaf node.
       return [ node ]
-    else:
-      # It is an intermediate node.
+
+    try:
+      return self._revision_ranges_cache[id(node)]
+    except KeyError:
+      # It is an intermediate node.  Aggregate the (memoized) results
+      # for the subnodes:
       revision_ranges = []
-      for key, subnode in node.items():
+      for subnode in node.itervalues():
         revision_ranges.extend(self._get_revision_ranges(subnode))
+      self._revision_ranges_cache[id(node)] = revision_ranges
       return revision_ranges
 
   def get_subsources(self):
     """Generate (CVSPath, FillSource) for all direct subsources."""
 
     if not isinstance(self._node_tree, SVNRevisionRange):
-      for cvs_path, node in self._node_tree.items():
-        fill_source = FillSource(cvs_path, self._symbol, node)
+      for cvs_path, node in self._node_tree.iteritems():
+        fill_source = FillSource(
+            cvs_path, self._symbol, node, self._revision_ranges_cache
+            )
         yield (cvs_path, fill_source)
 
   def get_subsource_map(self):
@@ -184,7 +221,7 @@ def get_source_set(symbol, range_map):
   root_cvs_directory = symbol.project.get_root_cvs_directory()
   fill_source = FillSource(root_cvs_directory, symbol, {})
 
-  for cvs_symbol, svn_revision_range in range_map.items():
+  for cvs_symbol, svn_revision_range in range_map.iteritems():
     fill_source._set_node(cvs_symbol.cvs_file, svn_revision_range)
 
   return fill_source
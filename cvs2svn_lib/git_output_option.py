@@ -206,6 +206,12 @@ class GitOutputOption(DVCSOutputOption):
         author_transforms
         )
 
+    # A map {cvsauthor : git author string} caching the full mapping
+    # of each author seen so far (including the default '%s <>' form
+    # for authors without a transform), so the string is only
+    # formatted once per author rather than once per commit:
+    self._author_map = {}
+
     self.tie_tag_fixup_branches = tie_tag_fixup_branches
 
     self._mark_generator = KeyGenerator(GitOutputOption._first_commit_mark)
@@ -272,7 +278,12 @@ class GitOutputOption(DVCSOutputOption):
     return self._map_author(cvs_author)
 
   def _map_author(self, cvs_author):
-    return self.author_transforms.get(cvs_author, "%s <>" % (cvs_author,))
+    try:
+      return self._author_map[cvs_author]
+    except KeyError:
+      author = self.author_transforms.get(cvs_author, "%s <>" % (cvs_author,))
+      self._author_map[cvs_author] = author
+      return author
 
   @staticmethod
   def _get_log_msg(svn_commit):
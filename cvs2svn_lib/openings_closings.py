@@ -70,50 +70,48 @@ class SymbolingsLogger:
   somewhere in the range 24 <= revnum < 30."""
 
   def __init__(self):
+    # The symbolings file is written strictly sequentially, so give it
+    # a generous buffer (same sizing as in sort.py):
     self.symbolings = open(
-        artifact_manager.get_temp_file(config.SYMBOL_OPENINGS_CLOSINGS), 'w')
+        artifact_manager.get_temp_file(config.SYMBOL_OPENINGS_CLOSINGS),
+        'w', 64 * 1024,
+        )
 
   def log_revision(self, cvs_rev, svn_revnum):
     """Log any openings and closings found in CVS_REV."""
 
-    for (symbol_id, cvs_symbol_id,) in cvs_rev.opened_symbols:
-      self._log_opening(symbol_id, cvs_symbol_id, svn_revnum)
-
-    for (symbol_id, cvs_symbol_id) in cvs_rev.closed_symbols:
-      self._log_closing(symbol_id, cvs_symbol_id, svn_revnum)
+    lines = [
+        self._format_line(symbol_id, cvs_symbol_id, svn_revnum, OPENING)
+        for (symbol_id, cvs_symbol_id,) in cvs_rev.opened_symbols
+        ]
+    lines.extend(
+        self._format_line(symbol_id, cvs_symbol_id, svn_revnum, CLOSING)
+        for (symbol_id, cvs_symbol_id) in cvs_rev.closed_symbols
+        )
+    if lines:
+      # Write all of the lines in one call, to avoid per-symbol I/O
+      # overhead:
+      self.symbolings.write(''.join(lines))
 
   def log_branch_revision(self, cvs_branch, svn_revnum):
     """Log any openings and closings found in CVS_BRANCH."""
 
-    for (symbol_id, cvs_symbol_id,) in cvs_branch.opened_symbols:
-      self._log_opening(symbol_id, cvs_symbol_id, svn_revnum)
+    lines = [
+        self._format_line(symbol_id, cvs_symbol_id, svn_revnum, OPENING)
+        for (symbol_id, cvs_symbol_id,) in cvs_branch.opened_symbols
+        ]
+    if lines:
+      self.symbolings.write(''.join(lines))
 
-  def _log(self, symbol_id, cvs_symbol_id, svn_revnum, type):
-    """Log an opening or closing to self.symbolings.
+  def _format_line(self, symbol_id, cvs_symbol_id, svn_revnum, type):
+    """Return a line for the symbol_openings_closings file.
 
-    Write out a single line to the symbol_openings_closings file
-    representing that SVN_REVNUM is either the opening or closing
-    (TYPE) of CVS_SYMBOL_ID for SYMBOL_ID.
+    The line represents that SVN_REVNUM is either the opening or
+    closing (TYPE) of CVS_SYMBOL_ID for SYMBOL_ID.
 
     TYPE should be one of the following constants: OPENING or CLOSING."""
 
-    self.symbolings.write(
-        '%x %d %s %x\n' % (symbol_id, svn_revnum, type, cvs_symbol_id)
-        )
-
-  def _log_opening(self, symbol_id, cvs_symbol_id, svn_revnum):
-    """Log an opening to self.symbolings.
-
-    See _log() for more information."""
-
-    self._log(symbol_id, cvs_symbol_id, svn_revnum, OPENING)
-
-  def _log_closing(self, symbol_id, cvs_symbol_id, svn_revnum):
-    """Log a closing to self.symbolings.
-
-    See _log() for more information."""
-
-    self._log(symbol_id, cvs_symbol_id, svn_revnum, CLOSING)
+    return '%x %d %s %x\n' % (symbol_id, svn_revnum, type, cvs_symbol_id)
 
   def close(self):
     self.symbolings.close()
@@ -157,23 +155,27 @@ class SymbolingsReader:
     SYMBOL is a TypedSymbol instance.  Yield the tuple (revnum, type,
     cvs_symbol_id) for all openings and closings for SYMBOL."""
 
-    if symbol.id in self.offsets:
+    offset = self.offsets.get(symbol.id)
+    if offset is not None:
       # Set our read offset for self.symbolings to the offset for this
       # symbol:
-      self.symbolings.seek(self.offsets[symbol.id])
+      self.symbolings.seek(offset)
 
+      # Hoist the attribute lookup out of the per-line loop:
+      readline = self.symbolings.readline
+
+      # Every line for SYMBOL starts with its id.  Checking the
+      # prefix (rather than parsing the id field of every line) both
+      # terminates the scan on the first line belonging to another
+      # symbol (or at EOF) and avoids converting the id field once
+      # per line:
+      prefix = '%x ' % (symbol.id,)
       while True:
-        line = self.symbolings.readline().rstrip()
-        if not line:
+        line = readline()
+        if not line.startswith(prefix):
           break
         (id, revnum, type, cvs_symbol_id) = line.split()
-        id = int(id, 16)
-        revnum = int(revnum)
-        if id != symbol.id:
-          break
-        cvs_symbol_id = int(cvs_symbol_id, 16)
-
-        yield (revnum, type, cvs_symbol_id)
+        yield (int(revnum), type, int(cvs_symbol_id, 16))
 
   def get_range_map(self, svn_symbol_commit):
     """Return the ranges of all CVSSymbols in SVN_SYMBOL_COMMIT.
@@ -318,7 +318,7 @@ class CollateSymbolsPass(Pass):
     parent_counts = stats.possible_parents.items()
     if parent_counts:
       self.symbol_info_file.write('      # Possible parents:\n')
-      parent_counts.sort(lambda a,b: cmp((b[1], a[0]), (a[1], b[0])))
+      parent_counts.sort(key=lambda (pp, count): (-count, pp))
       for (pp, count) in parent_counts:
         if isinstance(pp, Trunk):
           self.symbol_info_file.write(
@@ -1243,12 +1243,13 @@ class BreakAllChangesetCyclesPass(Pass):
 
     # Find the earliest successor ordinal:
     min_min_succ_ordinal = sys.maxint
-    for (max_pred_ordinal, min_succ_ordinal) in ordinal_limits.values():
+    for (max_pred_ordinal, min_succ_ordinal) in ordinal_limits.itervalues():
       min_min_succ_ordinal = min(min_min_succ_ordinal, min_succ_ordinal)
 
     early_item_ids = []
     late_item_ids = []
-    for (id, (max_pred_ordinal, min_succ_ordinal)) in ordinal_limits.items():
+    for (id, (max_pred_ordinal, min_succ_ordinal)) in \
+            ordinal_limits.iteritems():
       if max_pred_ordinal >= min_min_succ_ordinal:
         late_item_ids.append(id)
       else:
@@ -1683,22 +1684,23 @@ class IndexSymbolsPass(Pass):
 
     offsets = {}
 
+    # Open the file in binary mode and track the offset by hand, so
+    # that the file object's read-ahead buffering can be used instead
+    # of paying for a tell()/readline() pair on every line:
     f = open(
         artifact_manager.get_temp_file(
             config.SYMBOL_OPENINGS_CLOSINGS_SORTED),
-        'r')
+        'rb')
     old_id = None
-    while True:
-      fpos = f.tell()
-      line = f.readline()
-      if not line:
-        break
+    fpos = 0
+    for line in f:
       id, svn_revnum, ignored = line.split(" ", 2)
       id = int(id, 16)
       if id != old_id:
         logger.verbose(' ', Ctx()._symbol_db.get_symbol(id).name)
         old_id = id
         offsets[id] = fpos
+      fpos += len(line)
 
     f.close()
 
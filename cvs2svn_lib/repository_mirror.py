@@ -373,6 +373,11 @@ class _WritableMirrorDirectoryMixin:
   A MirrorDirectory is writable if it has already been recreated
   during the current revision."""
 
+  def is_writable(self):
+    """Return True iff this node can be mutated without being copied."""
+
+    return True
+
   def _set_entry(self, cvs_path, node):
     """Create or overwrite a subnode of this node, with no checks."""
 
@@ -389,19 +394,31 @@ class _WritableMirrorDirectoryMixin:
   def _mark_deleted(self):
     """Mark this object and any writable descendants as being deleted."""
 
-    self.__class__ = DeletedCurrentMirrorDirectory
+    # Use an explicit stack instead of recursion, to avoid per-node
+    # call overhead and any danger of hitting the recursion limit on
+    # deep trees:
+    stack = [self]
+    while stack:
+      node = stack.pop()
+      new_nodes = node.repo._new_nodes
+      node.__class__ = DeletedCurrentMirrorDirectory
 
-    for (cvs_path, id) in self._entries.iteritems():
-      if id in self.repo._new_nodes:
-        node = self[cvs_path]
-        if isinstance(node, _WritableMirrorDirectoryMixin):
-          # Mark deleted and recurse:
-          node._mark_deleted()
+      for (cvs_path, id) in node._entries.iteritems():
+        if id in new_nodes:
+          subnode = new_nodes[id]
+          if isinstance(subnode, _WritableMirrorDirectoryMixin):
+            # Mark deleted and descend:
+            stack.append(subnode)
 
 
 class _ReadOnlyMirrorDirectoryMixin:
   """Mixin for a CurrentMirrorDirectory that hasn't yet been made writable."""
 
+  def is_writable(self):
+    """Return True iff this node can be mutated without being copied."""
+
+    return False
+
   def _make_writable(self):
     raise NotImplementedError()
 
@@ -640,9 +657,12 @@ class _NodeDatabase(object):
         )
 
   def _load(self, items):
+    # Bind the bound method to a local; this method is called once per
+    # node read, and the loop body should be as cheap as possible:
+    get_path = self.cvs_path_db.get_path
     retval = {}
     for (id, value) in items:
-      retval[self.cvs_path_db.get_path(id)] = value
+      retval[get_path(id)] = value
     return retval
 
   def _dump(self, node):
@@ -761,6 +781,11 @@ class RepositoryMirror:
     # A map {node_id : _WritableMirrorDirectoryMixin}.
     self._new_nodes = {}
 
+    # A map {(lod, revnum, cvs_path) : OldMirrorDirectory} memoizing
+    # the directory nodes traversed by get_old_path() during this
+    # commit.  See get_old_path() for details.
+    self._old_path_cache = {}
+
   def end_commit(self):
     """Called at the end of each commit.
 
@@ -775,6 +800,7 @@ class RepositoryMirror:
         ])
 
     del self._new_nodes
+    del self._old_path_cache
 
   def _get_lod_history(self, lod):
     """Return the LODHistory instance describing LOD.
@@ -807,10 +833,30 @@ class RepositoryMirror:
     If CVS_PATH does not exist in the specified LOD and REVNUM, raise
     KeyError."""
 
-    node = self.get_old_lod_directory(lod, revnum)
+    # Symbol fills call this method once per source path, usually for
+    # many sibling paths under the same (LOD, REVNUM).  Therefore the
+    # directory nodes seen during the walk are memoized for the
+    # duration of the current commit, and the walk is resumed from the
+    # deepest ancestor that is already memoized.  The nodes belong to
+    # old revisions and are immutable, so sharing the instances is
+    # safe.
+    cache = self._old_path_cache
+    ancestry = cvs_path.get_ancestry()
+
+    # ancestry[0] is the root directory of LOD:
+    i = len(ancestry)
+    while i > 1:
+      node = cache.get((lod, revnum, ancestry[i - 1]))
+      if node is not None:
+        break
+      i -= 1
+    else:
+      node = self.get_old_lod_directory(lod, revnum)
 
-    for sub_path in cvs_path.get_ancestry()[1:]:
+    for sub_path in ancestry[i:]:
       node = node[sub_path]
+      if node is not None:
+        cache[(lod, revnum, sub_path)] = node
 
     return node
 
@@ -54,18 +54,13 @@ class SVNCommitCreator:
     non-trunk default branch is visible in a default CVS checkout of
     HEAD.  So we copy such commits over to Subversion's trunk so that
     checking out SVN trunk gives the same output as checking out of
-    CVS's default branch."""
+    CVS's default branch.
 
-    cvs_revs = [
-          cvs_rev
-          for cvs_rev in cvs_revs
-          if cvs_rev.ntdbr and not isinstance(cvs_rev, CVSRevisionNoop)
-          ]
+    CVS_REVS must contain only the non-trunk default branch revisions,
+    already sorted by RCS path (the caller filters them out of the
+    commit's revisions while making its symbolings-logging pass)."""
 
     if cvs_revs:
-      cvs_revs.sort(
-          lambda a, b: cmp(a.cvs_file.rcs_path, b.cvs_file.rcs_path)
-          )
       # Generate an SVNCommit for all of our default branch cvs_revs.
       yield SVNPostCommit(
           motivating_revnum, cvs_revs, timestamp,
@@ -96,15 +91,21 @@ class SVNCommitCreator:
 
     cvs_revs = list(changeset.iter_cvs_items())
     if cvs_revs:
-      cvs_revs.sort(lambda a, b: cmp(a.cvs_file.rcs_path, b.cvs_file.rcs_path))
+      cvs_revs.sort(key=lambda cvs_rev: cvs_rev.cvs_file.rcs_path)
       svn_commit = SVNPrimaryCommit(
           cvs_revs, timestamp, self.revnum_generator.gen_id()
           )
 
       yield svn_commit
 
+      # Log the symbolings and collect any non-trunk default branch
+      # revisions in a single pass over the (already-sorted) revisions:
+      log_revision = Ctx()._symbolings_logger.log_revision
+      ntdbr_cvs_revs = []
       for cvs_rev in cvs_revs:
-        Ctx()._symbolings_logger.log_revision(cvs_rev, svn_commit.revnum)
+        log_revision(cvs_rev, svn_commit.revnum)
+        if cvs_rev.ntdbr and not isinstance(cvs_rev, CVSRevisionNoop):
+          ntdbr_cvs_revs.append(cvs_rev)
 
       # Generate an SVNPostCommit if we have default branch revs.  If
       # some of the revisions in this commit happened on a non-trunk
@@ -116,7 +117,7 @@ class SVNCommitCreator:
       # revisions.  Therefore, we generate the copies in a new
       # revision.
       for svn_post_commit in self._post_commit(
-            cvs_revs, svn_commit.revnum, timestamp
+            ntdbr_cvs_revs, svn_commit.revnum, timestamp
             ):
         yield svn_post_commit
 
@@ -168,10 +169,9 @@ class SVNCommitCreator:
           self.revnum_generator.gen_id(),
           )
       yield svn_commit
+      log_branch_revision = Ctx()._symbolings_logger.log_branch_revision
       for cvs_branch in cvs_branches:
-        Ctx()._symbolings_logger.log_branch_revision(
-            cvs_branch, svn_commit.revnum
-            )
+        log_branch_revision(cvs_branch, svn_commit.revnum)
     else:
       logger.debug(
           'Omitting %r because it contains only CVSBranchNoops' % (changeset,)
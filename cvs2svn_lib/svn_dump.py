@@ -39,11 +39,23 @@ OP_ADD    = 'add'
 OP_CHANGE = 'change'
 
 
+# A cache of the results of utf8_path().  The same paths are emitted
+# over and over again (a directory path once per file it contains, an
+# LOD path once per path copied to or from the LOD), and the decoder
+# configuration cannot change during a conversion, so the translations
+# are worth remembering:
+_utf8_path_cache = {}
+
 def utf8_path(path):
   """Return a copy of PATH encoded in UTF-8."""
 
   try:
-    return Ctx().cvs_filename_decoder.decode_path(path).encode('utf8')
+    return _utf8_path_cache[path]
+  except KeyError:
+    pass
+
+  try:
+    utf8 = Ctx().cvs_filename_decoder.decode_path(path).encode('utf8')
   except UnicodeError:
     raise FatalError(
         "Unable to convert a path '%s' to internal encoding.\n"
@@ -51,6 +63,9 @@ def utf8_path(path):
         "with '--fallback-encoding'."
         % (path,))
 
+  _utf8_path_cache[path] = utf8
+  return utf8
+
 
 def generate_ignores(cvsignore, raw_ignore_val):
   ignore_vals = [ ]
@@ -108,7 +123,10 @@ class DumpstreamDelegate(SVNRepositoryDelegate):
 
     prop_strings = []
     for (k, v) in sorted(properties.iteritems()):
-      if k.startswith('_'):
+      # A leading underscore flags an internal-use property.  This
+      # test runs for every property of every node, so use a slice
+      # compare rather than the (method call) str.startswith:
+      if k[:1] == '_':
         # Such properties are for internal use only.
         pass
       elif v is None:
@@ -291,11 +309,13 @@ class DumpstreamDelegate(SVNRepositoryDelegate):
       if not Ctx().keep_cvsignore:
         return
 
-    checksum = md5()
-    checksum.update(data)
+    checksum = md5(data)
 
     # The content length is the length of property data, text data,
-    # and any metadata around/inside around them:
+    # and any metadata around/inside around them.  The property block
+    # (empty if there are no props) is folded into the header write so
+    # that only the (potentially large) text content needs a write of
+    # its own:
     self._dumpfile.write(
         'Node-path: %s\n'
         'Node-kind: file\n'
@@ -304,15 +324,14 @@ class DumpstreamDelegate(SVNRepositoryDelegate):
         'Text-content-length: %d\n'
         'Text-content-md5: %s\n'
         'Content-length: %d\n'
-        '\n' % (
+        '\n'
+        '%s' % (
             utf8_path(cvs_rev.get_svn_path()), op, props_header,
             len(data), checksum.hexdigest(), len(data) + len(prop_contents),
+            prop_contents,
             )
         )
 
-    if prop_contents:
-      self._dumpfile.write(prop_contents)
-
     self._dumpfile.write(data)
 
     # This record is done (write two newlines -- one to terminate
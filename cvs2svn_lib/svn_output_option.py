@@ -267,13 +267,17 @@ class SVNOutputOption(OutputOption):
 
     ancestry = cvs_directory.get_ancestry()
 
+    # This setting cannot change during a conversion, so evaluate it
+    # once instead of once per path component:
+    include_empty_directories = Ctx().include_empty_directories
+
     try:
       node = self._mirror.get_current_lod_directory(lod)
     except KeyError:
       logger.verbose("  Initializing %s" % (lod,))
       node = self._mirror.add_lod(lod)
       self._invoke_delegates('initialize_lod', lod)
-      if ancestry and Ctx().include_empty_directories:
+      if ancestry and include_empty_directories:
         self._make_empty_subdirectories(ancestry[0], lod)
 
     for sub_path in ancestry[1:]:
@@ -285,7 +289,7 @@ class SVNOutputOption(OutputOption):
             )
         node = node.mkdir(sub_path)
         self._invoke_delegates('mkdir', lod, sub_path)
-        if Ctx().include_empty_directories:
+        if include_empty_directories:
           self._make_empty_subdirectories(sub_path, lod)
       if node is None:
         raise self.ExpectedDirectoryError(
@@ -466,9 +470,11 @@ class SVNOutputOption(OutputOption):
     was copied in this revision, COPY_SOURCE should indicate where it
     was copied from; otherwise, COPY_SOURCE should be None."""
 
-    cvs_paths = src_entries.keys()
-    cvs_paths.sort()
-    for cvs_path in cvs_paths:
+    # Sort the entries once and iterate over (key, value) pairs, to
+    # avoid a second dict probe per entry in this hot loop:
+    src_items = src_entries.items()
+    src_items.sort()
+    for (cvs_path, src_entry) in src_items:
       if isinstance(cvs_path, CVSDirectory):
         # Path is a CVSDirectory:
         try:
@@ -476,23 +482,27 @@ class SVNOutputOption(OutputOption):
         except KeyError:
           # Path doesn't exist yet; it has to be created:
           dest_node = self._fill_directory(
-              symbol, None, src_entries[cvs_path], None
+              symbol, None, src_entry, None
               ).parent_mirror_dir
         else:
           # Path already exists, but might have to be cleaned up:
           dest_node = self._fill_directory(
-              symbol, dest_subnode, src_entries[cvs_path], copy_source
+              symbol, dest_subnode, src_entry, copy_source
               ).parent_mirror_dir
       else:
         # Path is a CVSFile:
         self._fill_file(
-            symbol, cvs_path in dest_node, src_entries[cvs_path], copy_source
+            symbol, cvs_path in dest_node, src_entry, copy_source
             )
         # Reread dest_node since the call to _fill_file() might have
-        # made it writable:
-        dest_node = self._mirror.get_current_path(
-            dest_node.cvs_path, dest_node.lod
-            )
+        # made it writable.  If it is already writable, then any
+        # modifications were made to dest_node itself, so the reread
+        # (which costs a node-database walk from the LOD root) can be
+        # skipped:
+        if not dest_node.is_writable():
+          dest_node = self._mirror.get_current_path(
+              dest_node.cvs_path, dest_node.lod
+              )
 
     return dest_node
 
@@ -595,12 +605,13 @@ class SVNOutputOption(OutputOption):
       plural = ""
     logger.verbose("Committing %d CVSRevision%s"
                   % (len(svn_commit.cvs_revs), plural))
+    prune = Ctx().prune
     for cvs_rev in svn_commit.cvs_revs:
       if isinstance(cvs_rev, CVSRevisionNoop):
         pass
 
       elif isinstance(cvs_rev, CVSRevisionDelete):
-        self.delete_path(cvs_rev.cvs_file, cvs_rev.lod, Ctx().prune)
+        self.delete_path(cvs_rev.cvs_file, cvs_rev.lod, prune)
 
       elif isinstance(cvs_rev, CVSRevisionAdd):
         self.add_path(cvs_rev)
@@ -698,9 +709,13 @@ class DumpfileOutputOption(SVNOutputOption):
     logger.quiet("Starting Subversion Dumpfile.")
     SVNOutputOption.setup(self, svn_rev_count)
     if not Ctx().dry_run:
+      # The dumpfile is written as many small records (headers,
+      # property blocks, path lines) interspersed with file contents,
+      # so give it a generous buffer (same sizing as in sort.py):
       self.add_delegate(
           DumpstreamDelegate(
-              Ctx().revision_reader, open(self.dumpfile_path, 'wb')
+              Ctx().revision_reader,
+              open(self.dumpfile_path, 'wb', 64 * 1024),
               )
           )
 
@@ -18,6 +18,7 @@
 
 
 import bisect
+from operator import itemgetter
 
 from cvs2svn_lib.common import SVN_INVALID_REVNUM
 
@@ -81,12 +82,8 @@ class RevisionScores:
     deltas_map = {}
 
     for range in svn_revision_ranges:
-      source_lod = range.source_lod
-      try:
-        deltas = deltas_map[source_lod]
-      except:
-        deltas = []
-        deltas_map[source_lod] = deltas
+      # setdefault() probes the dict only once per range:
+      deltas = deltas_map.setdefault(range.source_lod, [])
       deltas.append((range.opening_revnum, +1))
       if range.closing_revnum is not None:
         deltas.append((range.closing_revnum, -1))
@@ -103,7 +100,7 @@ class RevisionScores:
     # in the range REV2 <= REV < REV3 is equal to SCORE2.
     self._scores_map = {}
 
-    for (source_lod,deltas) in deltas_map.items():
+    for (source_lod, deltas) in deltas_map.iteritems():
       # Sort by revision number:
       deltas.sort()
 
@@ -158,14 +155,19 @@ class RevisionScores:
     best_revnum = SVN_INVALID_REVNUM
     best_score = 0
 
+    get_score = itemgetter(1)
     source_lods = self._scores_map.keys()
     source_lods.sort()
     for source_lod in source_lods:
-      for revnum, score in self._scores_map[source_lod]:
-        if score > best_score:
-          best_source_lod = source_lod
-          best_score = score
-          best_revnum = revnum
+      # max() scans the score list in C rather than in the
+      # interpreter.  Among entries with equal scores it returns the
+      # first one, i.e., the oldest revision, which is exactly the
+      # tie-breaking rule used here:
+      (revnum, score) = max(self._scores_map[source_lod], key=get_score)
+      if score > best_score:
+        best_source_lod = source_lod
+        best_score = score
+        best_revnum = revnum
     return best_source_lod, best_revnum, best_score
 
 
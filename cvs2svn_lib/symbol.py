@@ -109,7 +109,12 @@ class LineOfDevelopment(AbstractSymbol):
   def get_path(self, *components):
     """Return the svn path for this LineOfDevelopment."""
 
-    return path_join(self.base_path, *components)
+    if components:
+      return path_join(self.base_path, *components)
+    else:
+      # The LOD path itself is requested over and over again (several
+      # times per copy or delete), so avoid rebuilding it:
+      return self.base_path or ''
 
 
 class Trunk(LineOfDevelopment):
@@ -261,7 +261,7 @@ class _Stats:
   def __repr__(self):
     retval = ['%s\n  possible parents:\n' % (self,)]
     parent_counts = self.possible_parents.items()
-    parent_counts.sort(lambda a,b: - cmp(a[1], b[1]))
+    parent_counts.sort(key=lambda parent_count: -parent_count[1])
     for (symbol, count) in parent_counts:
       if isinstance(symbol, Trunk):
         retval.append('    trunk : %d\n' % count)
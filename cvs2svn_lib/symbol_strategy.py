@@ -528,7 +528,7 @@ class ManualSymbolRule(StrategyRule):
         return pp
     else:
       parent_counts = stats.possible_parents.items()
-      parent_counts.sort(lambda a,b: - cmp(a[1], b[1]))
+      parent_counts.sort(key=lambda parent_count: -parent_count[1])
       lines = [
           '%s is not a valid parent for %s;'
               % (parent_lod_name, stats.lod,),
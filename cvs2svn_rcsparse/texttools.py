@@ -29,7 +29,7 @@ _idchar_list.remove(',')
 _idchar_list.remove(':')
 _idchar_list.remove(';')
 _idchar_list.remove('@')
-_idchar = string.join(_idchar_list, '')
+_idchar = ''.join(_idchar_list)
 _idchar_set = _tt.set(_idchar)
 
 _onechar_token_set = _tt.set(':;')
@@ -217,7 +217,7 @@ class _mxTokenStream:
       if not success:
         # The start of this buffer was not a token. So the end of the
         # prior buffer was a complete token.
-        self.tokens.insert(0, string.join(chunks, ''))
+        self.tokens.insert(0, ''.join(chunks))
       else:
         assert len(taglist) == 1 and taglist[0][0] == _T_TOKEN \
                and taglist[0][1] == 0 and taglist[0][2] == idx
@@ -235,7 +235,7 @@ class _mxTokenStream:
 
         # got the rest of the token.
         chunks.append(buf[:idx])
-        self.tokens.insert(0, string.join(chunks, ''))
+        self.tokens.insert(0, ''.join(chunks))
 
       # no more partial token
       self.partial = None
@@ -244,7 +244,7 @@ class _mxTokenStream:
 
     if which == _T_STRING_END:
       if buf[0] != '@':
-        self.tokens.insert(0, string.join(chunks, ''))
+        self.tokens.insert(0, ''.join(chunks))
         return 0
       chunks.append('@')
       start = 1
@@ -278,7 +278,7 @@ class _mxTokenStream:
       self.partial = (_T_STRING_SPAN, chunks)
     elif self.string_end < len(buf):
       self.partial = None
-      self.tokens.insert(0, string.join(chunks, ''))
+      self.tokens.insert(0, ''.join(chunks))
     else:
       self.partial = (_T_STRING_END, chunks)
 